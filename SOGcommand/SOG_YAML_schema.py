@@ -27,10 +27,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from datetime import datetime
+import weakref
 import colander
+import six
 
 
-__all__ = ['YAML_Infile', 'yaml_to_infile']
+__all__ = ['YAML_Infile', 'quantities_index', 'yaml_to_infile']
+
+
+# Cache of quantity indices built by quantities_index()
+_quantities_indices = weakref.WeakKeyDictionary()
 
 
 @colander.deferred
@@ -39,61 +45,43 @@ def _deferred_allow_missing(node, kw):
     return None if allow_missing else colander.required
 
 
-class _SOG_YAML_Base(colander.MappingSchema):
-    """Base class for SOG YAML infile quantities.
-    """
-    units = colander.SchemaNode(
-        colander.String(), default=None,
-        missing=None)
-    var_name = colander.SchemaNode(
-        colander.String(), name='variable_name',
-        missing=_deferred_allow_missing)
-    description = colander.SchemaNode(
-        colander.String(),
-        missing=_deferred_allow_missing)
-
-
-class _Float(_SOG_YAML_Base):
-    value = colander.SchemaNode(colander.Float())
-
-
-class _Int(_SOG_YAML_Base):
-    value = colander.SchemaNode(colander.Int())
-
-
-class _Boolean(_SOG_YAML_Base):
-    value = colander.SchemaNode(colander.Boolean())
-
-
-class _SOG_String(_SOG_YAML_Base):
-    value = colander.SchemaNode(colander.String())
-
-
 class _DateTime(colander.SchemaType):
     """Replacement for Colander's ISO8601 DateTime type.
 
     We don't care about time zone, and want the string representation
     of a datetime to be `yyy-mm-dd hh:mm:ss`.
     """
-    def serialize(self, node, appstruct):
-        if appstruct is colander.null:
+    def _check(self, node, struct):
+        if struct is colander.null:
             return colander.null
-        if not isinstance(appstruct, datetime):
+        # YAML loaders produce plain datetime instances
+        if type(struct) is not datetime:
             raise colander.Invalid(
-                node, '{0!r} is not a datetime'.format(appstruct))
-        return appstruct
+                node, '{0!r} is not a datetime'.format(struct))
+        return struct
 
-    def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
-        if not isinstance(cstruct, datetime):
-            raise colander.Invalid(
-                node, '{0!r} is not a datetime'.format(cstruct))
-        return cstruct
+    serialize = deserialize = _check
 
 
-class _SOG_Datetime(_SOG_YAML_Base):
-    value = colander.SchemaNode(_DateTime())
+def _validate_list(node, cstruct, item_types, item_kind):
+    """Validate that cstruct is a list of item_types instances,
+    and return it unchanged.
+
+    The items are checked with isinstance() rather than by building an
+    :class:`array.array` from them because array typecodes limit the
+    size of the values that they accept, and they accept other types,
+    like :class:`decimal.Decimal`, that can be converted to numbers.
+    """
+    if cstruct is colander.null:
+        return colander.null
+    if not isinstance(cstruct, list):
+        raise colander.Invalid(
+            node, '{0!r} is not a list'.format(cstruct))
+    if not all(isinstance(item, item_types) for item in cstruct):
+        raise colander.Invalid(
+            node, '{0!r} contains item that is not {1}'
+            .format(cstruct, item_kind))
+    return cstruct
 
 
 class _FloatList(colander.SchemaType):
@@ -101,33 +89,11 @@ class _FloatList(colander.SchemaType):
 
     Validates that we're working with a list of numbers.
     """
-    def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
-        if not isinstance(appstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(appstruct))
-        if not all(isinstance(item, (int, float)) for item in appstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not a number'
-                .format(appstruct))
-        return appstruct
+    def _check(self, node, struct):
+        return _validate_list(
+            node, struct, six.integer_types + (float,), 'a number')
 
-    def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
-        if not isinstance(cstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(cstruct))
-        if not all(isinstance(item, (int, float)) for item in cstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not a number'
-                .format(cstruct))
-        return cstruct
-
-
-class _SOG_FloatList(_SOG_YAML_Base):
-    value = colander.SchemaNode(_FloatList())
+    serialize = deserialize = _check
 
 
 class _IntList(colander.SchemaType):
@@ -135,33 +101,63 @@ class _IntList(colander.SchemaType):
 
     Validates that we're working with a list of integers.
     """
-    def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
-        if not isinstance(appstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(appstruct))
-        if not all(isinstance(item, int) for item in appstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not an integer'
-                .format(appstruct))
-        return appstruct
+    def _check(self, node, struct):
+        return _validate_list(node, struct, six.integer_types, 'an integer')
+
+    serialize = deserialize = _check
+
+
+# Colander schema types are stateless, so a single instance of each
+# is shared by all of the schema nodes that use it
+_FLOAT = colander.Float()
+_INT = colander.Int()
+_BOOLEAN = colander.Boolean()
+_STRING = colander.String()
+_DATETIME = _DateTime()
+_FLOAT_LIST = _FloatList()
+_INT_LIST = _IntList()
+
+
+class _SOG_YAML_Base(colander.MappingSchema):
+    """Base class for SOG YAML infile quantities.
+    """
+    units = colander.SchemaNode(
+        _STRING, default=None,
+        missing=None)
+    var_name = colander.SchemaNode(
+        _STRING, name='variable_name',
+        missing=_deferred_allow_missing)
+    description = colander.SchemaNode(
+        _STRING,
+        missing=_deferred_allow_missing)
+
+
+class _Float(_SOG_YAML_Base):
+    value = colander.SchemaNode(_FLOAT)
+
+
+class _Int(_SOG_YAML_Base):
+    value = colander.SchemaNode(_INT)
+
+
+class _Boolean(_SOG_YAML_Base):
+    value = colander.SchemaNode(_BOOLEAN)
+
+
+class _SOG_String(_SOG_YAML_Base):
+    value = colander.SchemaNode(_STRING)
 
-    def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
-        if not isinstance(cstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(cstruct))
-        if not all(isinstance(item, int) for item in cstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not an integer'
-                .format(cstruct))
-        return cstruct
+
+class _SOG_Datetime(_SOG_YAML_Base):
+    value = colander.SchemaNode(_DATETIME)
+
+
+class _SOG_FloatList(_SOG_YAML_Base):
+    value = colander.SchemaNode(_FLOAT_LIST)
 
 
 class _SOG_IntList(_SOG_YAML_Base):
-    value = colander.SchemaNode(_IntList())
+    value = colander.SchemaNode(_INT_LIST)
 
 
 class _InitialConditions(colander.MappingSchema):
@@ -1427,31 +1423,59 @@ def yaml_to_infile(yaml_schema, yaml_struct):
     :returns: SOG YAML infile data structure.
     :rtype: nested dicts
     """
-    def get_element(key, path):
+    result = {}
+    for path, infile_key, var_name in quantities_index(yaml_schema):
+        # Descend directly through the nested dicts rather than having
+        # the schema re-split a dotted path and search its children
         try:
-            return yaml_schema.get_value(yaml_struct, '.'.join((path, key)))
+            element = yaml_struct
+            for name in path:
+                element = element[name]
+            result[infile_key] = {
+                'value': element['value'],
+                'description': element['description'],
+                'units': element['units'],
+            }
         except TypeError:
-            raise ValueError('{} element missing from YAML infile'.format(path))
-
-    def transform(node, path):
-        return {
-            node.infile_key: {
-                'value': get_element('value', path),
-                'description': get_element('description', path),
-                'units': get_element('units', path),
-            }}
-
-    def walk_subnodes(node, path):
-        result = {}
-        if not any(child.children for child in node.children):
-            return transform(node, path)
-        else:
-            for child in node.children:
-                result.update(
-                    walk_subnodes(child, '.'.join((path, child.name))))
-            return result
-
-    result = {}
-    for node in yaml_schema:
-        result.update(walk_subnodes(node, node.name))
+            raise ValueError(
+                '{} element missing from YAML infile'.format('.'.join(path)))
     return result
+
+
+def quantities_index(yaml_schema):
+    """Return an index of the SOG quantities in a SOG YAML infile schema.
+
+    The schema structure doesn't change once it has been instantiated,
+    so the index is built on first use and cached for each schema
+    instance.
+
+    :arg yaml_schema: SOG YAML infile schema instance
+    :type yaml_schema: :class:`YAML_Infile` instance
+
+    :returns: (path tuple, infile key, variable name) tuples
+              for the quantities, in schema order.
+    :rtype: list
+    """
+    try:
+        return _quantities_indices[yaml_schema]
+    except KeyError:
+        index = []
+        stack = [
+            (node, (node.name,)) for node in reversed(yaml_schema.children)]
+        while stack:
+            node, path = stack.pop()
+            if _is_quantity(node):
+                index.append((path, node.infile_key, node.var_name))
+            else:
+                stack.extend(
+                    (child, path + (child.name,))
+                    for child in reversed(node.children))
+        _quantities_indices[yaml_schema] = index
+        return index
+
+
+def _is_quantity(node):
+    """Return a boolean indicating whether or not node is a SOG quantity
+    (i.e. a mapping of value, units, etc.) rather than a block of nodes.
+    """
+    return not any(child.children for child in node.children)
@@ -33,11 +33,17 @@ limitations under the License.
 """
 import re
 import colander
+from six.moves import filter
 
 
 __all__ = ['dump', 'load']
 
 
+_KEY_VALUE_SEPARATOR = re.compile(r'"\s+')
+_VALUE_DESC_SEPARATOR = re.compile(r'\s+"')
+_UNITS_CONTAINER = re.compile(r'\[(?P<units>.+)\]')
+
+
 def load(stream):
     """Load the parameter keys, values and descriptions from a SOG
     infile into a Python data structure.
@@ -68,44 +74,44 @@ def load(stream):
     the units item in the dict is an empty string if the description
     does not contain a [] pair.
     """
-    key_value_separator = re.compile(r'"\s+')
-    value_desc_separator = re.compile(r'\s+"')
-    units_container = re.compile(r'\[.+\]')
-
-    def get_line():
-        line = next(stream).strip()
-        if line == '' or line.startswith('!'):
-            line = get_line()
-        return line
-
+    lines = _iter_lines(stream)
     result = {}
-    while True:
-        try:
-            line = get_line()
+    try:
+        for line in lines:
             try:
-                key, line = key_value_separator.split(line, 1)
+                key, line = _KEY_VALUE_SEPARATOR.split(line, 1)
             except ValueError:
-                line = ' '.join((line, get_line()))
-                key, line = key_value_separator.split(line, 1)
+                line = ' '.join((line, next(lines)))
+                key, line = _KEY_VALUE_SEPARATOR.split(line, 1)
             key = key.strip('"')
             try:
-                value, description = value_desc_separator.split(line, 1)
+                value, description = _VALUE_DESC_SEPARATOR.split(line, 1)
             except ValueError:
-                line = ' '.join((line, get_line()))
-                value, description = value_desc_separator.split(line, 1)
+                line = ' '.join((line, next(lines)))
+                value, description = _VALUE_DESC_SEPARATOR.split(line, 1)
             value = value.strip('"')
             description = description.strip('"')
-            m = units_container.search(description)
+            m = _UNITS_CONTAINER.search(description)
             if m:
-                units = m.group()
-                description = description.replace(units, '').strip()
-                units = units.strip('[]')
+                description = (
+                    description[:m.start()] + description[m.end():]).strip()
+                units = m.group('units')
             else:
                 units = None
             result[key] = {
                 'value': value, 'description': description, 'units': units}
-        except StopIteration:
-            return result
+    except StopIteration:
+        # Stream ended part way through a multi-line infile item
+        pass
+    return result
+
+
+def _iter_lines(stream):
+    """Return an iterator over the stripped lines from stream,
+    skipping empty lines and comments.
+    """
+    lines = filter(None, (line.strip() for line in stream))
+    return (line for line in lines if not line.startswith('!'))
 
 
 def dump(data, key_order, extra_keys, avg_hist_forcing_keys, stream):
@@ -151,38 +157,52 @@ def dump(data, key_order, extra_keys, avg_hist_forcing_keys, stream):
     will be excluded from the description phrase in the SOG infile
     line.
     """
-    def build_line(key):
-        line = '"{0}"  {1[value]}  "{1[description]}'.format(key, data[key])
-        max_line_len = (240 if data[key]['units'] == colander.null
-                        else 240 - (len(data[key]['units']) + 3))
+    def build_line(key, item):
+        value, description, units = (
+            item['value'], item['description'], item['units'])
+        line = '"{0}"  {1}  "{2}'.format(key, value, description)
+        max_line_len = (240 if units == colander.null
+                        else 240 - (len(units) + 3))
         if len(line) > max_line_len:
-            line = '"{0}"\n'.format(key)
-            for v in data[key]['value'].split():
-                line += '  {0}\n'.format(v)
-            line += '  "{0[description]}'.format(data[key])
-        if data[key]['units'] != 'None':
-            line = '{0} [{1[units]}]'.format(line, data[key])
+            parts = ['"{0}"'.format(key)]
+            parts.extend('  ' + v for v in value.split())
+            parts.append('  "' + description)
+            line = '\n'.join(parts)
+        if units != 'None':
+            line = '{0} [{1}]'.format(line, units)
         return line
 
-    def handle_extra_keys(key):
-        if key in extra_keys:
-            for extra_key in extra_keys[key][data[key]['value']]:
-                line = build_line(extra_key)
-                stream.write('{0}"\n'.format(line))
-                handle_extra_keys(extra_key)
+    def extra_keys_for(key, item):
+        if key not in extra_keys:
+            return ()
+        return extra_keys[key][item['value']]
+
+    def handle_extra_keys(key, item):
+        # Depth-first worklist so that the extra keys of an extra key
+        # immediately follow it, without recursing for each level
+        stack = list(reversed(extra_keys_for(key, item)))
+        while stack:
+            extra_key = stack.pop()
+            extra_item = data[extra_key]
+            lines.append(build_line(extra_key, extra_item))
+            stack.extend(reversed(extra_keys_for(extra_key, extra_item)))
 
     def handle_avg_hist_forcing(key):
         try:
-            trigger = avg_hist_forcing_keys[key]['trigger']
+            forcing_keys = avg_hist_forcing_keys[key]
+            trigger = forcing_keys['trigger']
         except KeyError:
             return
         trigger_value = data[trigger]['value'].strip('"')
-        for special_key in avg_hist_forcing_keys[key][trigger_value]:
-            line = build_line(special_key)
-            stream.write('{0}"\n'.format(line))
+        for special_key in forcing_keys[trigger_value]:
+            lines.append(build_line(special_key, data[special_key]))
 
+    # Accumulate the lines and write them to the stream in one go
+    lines = []
     for key in key_order:
-        line = build_line(key)
+        item = data[key]
+        line = build_line(key, item)
         handle_avg_hist_forcing(key)
-        stream.write('{0}"\n'.format(line))
-        handle_extra_keys(key)
+        lines.append(line)
+        handle_extra_keys(key, item)
+    stream.write(''.join('{0}"\n'.format(line) for line in lines))
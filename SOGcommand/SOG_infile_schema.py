@@ -29,6 +29,7 @@ limitations under the License.
 from datetime import datetime
 import colander
 import six
+from .SOG_YAML_schema import quantities_index
 
 
 __all__ = [
@@ -36,11 +37,18 @@ __all__ = [
 ]
 
 
-class _SOG_InfileBase(colander.MappingSchema):
-    """Base class for SOG Fortran-ish infile quantities.
+# Bound once so that the (de)serializers don't look it up through the
+# colander module on every call
+_NULL = colander.null
+
+
+def _invalid(node, value, problem):
+    """Return a :class:`colander.Invalid` exception for node
+    that describes the problem with value.
+
+    The message is only formatted when a type check fails.
     """
-    description = colander.SchemaNode(colander.String())
-    units = colander.SchemaNode(colander.String(), default=None, missing=None)
+    return colander.Invalid(node, '{0!r} {1}'.format(value, problem))
 
 
 class _RealDP(object):
@@ -50,27 +58,23 @@ class _RealDP(object):
     separator so that Fortran list directed input will convert number
     properly to real(kind=dp).
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, (int, float)):
-            raise colander.Invalid(
-                node, '{0!r} is not a number'.format(appstruct))
-        return '{0:e}'.format(appstruct).replace('e', 'd')
+            raise _invalid(node, appstruct, 'is not a number')
+        return ('%e' % appstruct).replace('e', 'd')
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
+            raise _invalid(node, cstruct, 'is not a string')
         return float(cstruct.replace('d', 'e'))
 
 
-class _SOG_RealDP(_SOG_InfileBase):
-    value = colander.SchemaNode(_RealDP())
-
-
 class _RealDP_List(object):
     """List of Fortran real(kind=dp) type values.
 
@@ -80,34 +84,26 @@ class _RealDP_List(object):
 
     Python representation is a list of floats.
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(appstruct))
+            raise _invalid(node, appstruct, 'is not a list')
         if not all(isinstance(item, (int, float)) for item in appstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not a number'
-                .format(appstruct))
-        return ' '.join(
-            '{0:e}'.format(item).replace('e', 'd') for item in appstruct)
+            raise _invalid(
+                node, appstruct, 'contains item that is not a number')
+        # Swap the exponent separators in one pass over the joined string
+        return ' '.join(['%e' % item for item in appstruct]).replace('e', 'd')
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
-        return [float(item.replace('d', 'e')) for item in cstruct.split()]
-
-
-class _SOG_RealDP_List(_SOG_InfileBase):
-    value = colander.SchemaNode(_RealDP_List())
-
-
-class _SOG_Int(_SOG_InfileBase):
-    value = colander.SchemaNode(colander.Int())
+            raise _invalid(node, cstruct, 'is not a string')
+        # Swap the exponent separators in one pass over the whole string
+        return list(map(float, cstruct.replace('d', 'e').split()))
 
 
 class _IntList(object):
@@ -119,29 +115,29 @@ class _IntList(object):
 
     Python representation is a list of ints.
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, list):
-            raise colander.Invalid(
-                node, '{0!r} is not a list'.format(appstruct))
-        if not all(isinstance(item, int) for item in appstruct):
-            raise colander.Invalid(
-                node, '{0!r} contains item that is not an integer'
-                .format(appstruct))
-        return ' '.join('{0:d}'.format(item) for item in appstruct)
+            raise _invalid(node, appstruct, 'is not a list')
+        try:
+            return ' '.join('{0:d}'.format(item) for item in appstruct)
+        except (TypeError, ValueError):
+            raise _invalid(
+                node, appstruct, 'contains item that is not an integer')
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
-        return [int(item) for item in cstruct.split()]
+            raise _invalid(node, cstruct, 'is not a string')
+        return list(map(int, cstruct.split()))
 
 
-class _SOG_IntList(_SOG_InfileBase):
-    value = colander.SchemaNode(_IntList())
+# SOG datetime text representation format
+_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 class _Datetime(object):
@@ -150,25 +146,40 @@ class _Datetime(object):
     Text representation has the format `"yyyy-mm-dd hh:mm:ss"` expected
     by SOG.
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, datetime):
-            raise colander.Invalid(
-                node, '{0!r} is not a datetime'.format(appstruct))
-        return '"{0:%Y-%m-%d %H:%M:%S}"'.format(appstruct)
+            raise _invalid(node, appstruct, 'is not a datetime')
+        return '"{0}"'.format(appstruct.strftime(_DATETIME_FORMAT))
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
-        return datetime.strptime(cstruct, '%Y-%m-%d %H:%M:%S')
-
-
-class _SOG_Datetime(_SOG_InfileBase):
-    value = colander.SchemaNode(_Datetime())
+            raise _invalid(node, cstruct, 'is not a string')
+        # Slice the fixed width fields directly when the string has the
+        # expected layout, rather than running strptime's format parser
+        digits = ''.join((
+            cstruct[0:4], cstruct[5:7], cstruct[8:10],
+            cstruct[11:13], cstruct[14:16], cstruct[17:19]))
+        if (len(cstruct) == 19 and digits.isdigit()
+                and cstruct[4] == cstruct[7] == '-' and cstruct[10] == ' '
+                and cstruct[13] == cstruct[16] == ':'):
+            try:
+                return datetime(
+                    int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]),
+                    int(digits[12:14]))
+            except ValueError:
+                pass
+        return datetime.strptime(cstruct, _DATETIME_FORMAT)
+
+
+# Fortran text representations of Python booleans
+_BOOLEAN_TEXT = {True: '.true.', False: '.false.'}
 
 
 class _Boolean(object):
@@ -176,27 +187,24 @@ class _Boolean(object):
 
     Text representation is Fortran syntax: `.true.` or `.false.`.
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, bool):
-            raise colander.Invalid(
-                node, '{0!r} is not a boolean'.format(appstruct))
-        return appstruct and '.true.' or '.false.'
+            raise _invalid(node, appstruct, 'is not a boolean')
+        return _BOOLEAN_TEXT[appstruct]
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
-        if cstruct.lower() == '.true.':
-            return True
-        return False
-
-
-class _SOG_Boolean(_SOG_InfileBase):
-    value = colander.SchemaNode(_Boolean())
+            raise _invalid(node, cstruct, 'is not a string')
+        # Only strings of the same length as .true. need a case-insensitive
+        # comparison, so .false. and the usual spelling don't get copied
+        return cstruct == '.true.' or (
+            len(cstruct) == 6 and cstruct.lower() == '.true.')
 
 
 class _String(object):
@@ -205,25 +213,69 @@ class _String(object):
    SOG works with plain ASCII strings, not Unicode. Serialized strings are
    enclosed in double quotes.
     """
+    __slots__ = ()
+
     def serialize(self, node, appstruct):
-        if appstruct is colander.null:
-            return colander.null
+        if appstruct is _NULL:
+            return _NULL
         if not isinstance(appstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(appstruct))
-        return '"{0}"'.format(appstruct)
+            raise _invalid(node, appstruct, 'is not a string')
+        return '"' + appstruct + '"'
 
     def deserialize(self, node, cstruct):
-        if cstruct is colander.null:
-            return colander.null
+        if cstruct is _NULL:
+            return _NULL
         if not isinstance(cstruct, six.string_types):
-            raise colander.Invalid(
-                node, '{0!r} is not a string'.format(cstruct))
+            raise _invalid(node, cstruct, 'is not a string')
         return str(cstruct)
 
 
+# Type instances used by the SOG quantity schemas below.
+# _TEXT is the plain Colander string for descriptions and units,
+# whereas _STRING is the double quoted Fortran string value type.
+_TEXT = colander.String()
+_STRING = _String()
+_REAL_DP = _RealDP()
+_REAL_DP_LIST = _RealDP_List()
+_INT = colander.Int()
+_INT_LIST = _IntList()
+_DATETIME = _Datetime()
+_BOOLEAN = _Boolean()
+
+
+class _SOG_InfileBase(colander.MappingSchema):
+    """Base class for SOG Fortran-ish infile quantities.
+    """
+    description = colander.SchemaNode(_TEXT)
+    units = colander.SchemaNode(_TEXT, default=None, missing=None)
+
+
+class _SOG_RealDP(_SOG_InfileBase):
+    value = colander.SchemaNode(_REAL_DP)
+
+
+class _SOG_RealDP_List(_SOG_InfileBase):
+    value = colander.SchemaNode(_REAL_DP_LIST)
+
+
+class _SOG_Int(_SOG_InfileBase):
+    value = colander.SchemaNode(_INT)
+
+
+class _SOG_IntList(_SOG_InfileBase):
+    value = colander.SchemaNode(_INT_LIST)
+
+
+class _SOG_Datetime(_SOG_InfileBase):
+    value = colander.SchemaNode(_DATETIME)
+
+
+class _SOG_Boolean(_SOG_InfileBase):
+    value = colander.SchemaNode(_BOOLEAN)
+
+
 class _SOG_String(_SOG_InfileBase):
-    value = colander.SchemaNode(_String())
+    value = colander.SchemaNode(_STRING)
 
 
 class SOG_Infile(colander.MappingSchema):
@@ -606,8 +658,8 @@ class SOG_Infile(colander.MappingSchema):
     minor_river_integration_days = _SOG_Int(name='minor river integ days')
     alt_minor_river_forcing_file = _SOG_String(name='alt minor river')
 
-# List of keys, in order, to create a SOG infile
-SOG_KEYS = [
+# Keys, in order, to create a SOG infile
+SOG_KEYS = (
     'latitude', 'pCO2_atm',
     'maxdepth',  'gridsize', 'lambda',
     'init datetime', 'end datetime', 'dt', 'chem_dt', 'max_iter',
@@ -725,7 +777,7 @@ SOG_KEYS = [
     'wind', 'air temp', 'cloud', 'humidity',
     'major river', 'use river temp',
     'minor river', 'minor river integ days','river nutrients file'
-]
+)
 # Lists of extra keys, in order, to include in SOG infile for optional
 # parameters, keyed by optional parameter trigger
 SOG_EXTRA_KEYS = {
@@ -837,7 +889,10 @@ def infile_to_yaml(yaml_schema, infile_schema, infile_struct):
     :arg yaml_schema: SOG YAML infile schema instance
     :type yaml_schema: :class:`YAML_Infile` instance
 
-    :arg infile_schema: SOG Fortran-ish infile schema instance
+    :arg infile_schema: SOG Fortran-ish infile schema instance;
+                        not used, kept for signature compatibility
+                        because the infile items are indexed directly
+                        by their infile keys.
     :type infile_schema: :class:`SOG_Infile` instance
 
     :arg infile_struct: SOG Fortran-ish infile data structure
@@ -846,31 +901,21 @@ def infile_to_yaml(yaml_schema, infile_schema, infile_struct):
     :returns: SOG YAML infile data structure.
     :rtype: nested dicts
     """
-    def get_element(node, key):
-        return infile_schema.get_value(
-            infile_struct, '{0.infile_key}.{1}'.format(node, key))
-
-    def transform(node):
-        result = {
-            'value': get_element(node, 'value'),
-            'description': str(get_element(node, 'description')),
-            'variable name': node.var_name,
+    result = {}
+    for path, infile_key, var_name in quantities_index(yaml_schema):
+        block = result
+        for name in path[:-1]:
+            block = block.setdefault(name, {})
+        # Index the infile item directly; infile keys may contain dots,
+        # so they can't be used in a dotted get_value() path
+        item = infile_struct[infile_key]
+        element = {
+            'value': item['value'],
+            'description': str(item['description']),
+            'variable name': var_name,
         }
-        units = get_element(node, 'units')
+        units = item['units']
         if units is not None:
-            result['units'] = str(units)
-        return result
-
-    def walk_subnodes(node):
-        result = {}
-        if not any(child.children for child in node.children):
-            return transform(node)
-        else:
-            for child in node.children:
-                result.update({child.name: walk_subnodes(child)})
-            return result
-
-    result = {}
-    for node in yaml_schema:
-        result.update({node.name: walk_subnodes(node)})
+            element['units'] = str(units)
+        block[path[-1]] = element
     return result
@@ -40,6 +40,11 @@ __all__ = ['Args', 'batch', 'read_infile', 'run']
 class Args(object):
     """Container for SOG command arguments.
     """
+    __slots__ = (
+        'SOG_exec', 'infile', 'editfile', 'outfile', 'legacy_infile',
+        'dry_run', 'nice',
+    )
+
     def __init__(self, SOG_exec, infile, editfiles, outfile, legacy_infile,
                  dry_run, nice):
         self.SOG_exec = SOG_exec
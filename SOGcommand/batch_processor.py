@@ -39,6 +39,7 @@ import time
 import six
 import yaml
 from . import run_processor
+from .yaml_loader import SafeLoader as _SafeLoader
 
 
 __all__ = ['BatchProcessor', 'Job']
@@ -80,6 +81,11 @@ class Job(object):
                         Defaults to :kbd:`False`.
     :type legacy_infile: boolean
     """
+    __slots__ = (
+        'jobname', 'SOG_exec', 'infile', 'editfile', 'outfile', 'nice',
+        'legacy_infile', 'dry_run', 'process', 'pid', 'returncode',
+    )
+
     def __init__(self, jobname, SOG_exec, infile, editfiles, outfile,
                  nice=19, legacy_infile=False):
         self.jobname = jobname
@@ -154,49 +160,42 @@ class BatchProcessor(object):
     def _read_config(self):
         log.info('building jobs described in {.batchfile}'.format(self))
         with open(self.batchfile, 'rt') as f:
-            self.config = yaml.safe_load(f.read())
+            self.config = yaml.load(f, Loader=_SafeLoader)
         if 'max_concurrent_jobs' in self.config:
             self.max_concurrent_jobs = self.config['max_concurrent_jobs']
         log.info(
             'max concurrent jobs: {.max_concurrent_jobs}'.format(self))
 
     def _build_jobs(self):
-        try:
-            default_editfiles = self.config['edit_files']
-        except KeyError:
-            default_editfiles = []
+        default_editfiles = self.config.get('edit_files', [])
         log.debug(
-            'YAML edit files that will be used in all jobs (in order): {}'
-            .format(default_editfiles))
+            'YAML edit files that will be used in all jobs (in order): %s',
+            default_editfiles)
         default_legacy_infile = self._legacy_infile_default_rules()
         for job in self.config['jobs']:
-            jobname = list(six.iterkeys(job))[0]
+            jobname = next(iter(job))
+            job_config = job[jobname]
             log.info('building command for job: {}'.format(jobname))
             SOG_exec = self._job_or_default(jobname, job, 'SOG_executable')
             infile = self._job_or_default(jobname, job, 'base_infile')
-            try:
-                job_editfiles = job[jobname]['edit_files']
-            except KeyError:
-                job_editfiles = []
-            log.debug(
-                '{}: YAML edit files (in order): {}'
-                .format(jobname, default_editfiles + job_editfiles))
-            try:
-                outfile = job[jobname]['outfile']
-            except KeyError:
-                if job_editfiles:
-                    outfile = '.'.join((job_editfiles[-1], 'out'))
-                else:
-                    outfile = '.'.join((infile, 'out'))
-            log.debug('{}: stdout stored in: {}'.format(jobname, outfile))
+            job_editfiles = job_config.get('edit_files', [])
+            editfiles = default_editfiles + job_editfiles
+            log.debug('%s: YAML edit files (in order): %s', jobname, editfiles)
+            if 'outfile' in job_config:
+                outfile = job_config['outfile']
+            elif job_editfiles:
+                outfile = '.'.join((job_editfiles[-1], 'out'))
+            else:
+                outfile = '.'.join((infile, 'out'))
+            log.debug('%s: stdout stored in: %s', jobname, outfile)
             legacy_infile = (default_legacy_infile or
                              self._legacy_infile_job_rules(jobname, job))
-            log.debug('{}: legacy infile: {}'.format(jobname, legacy_infile))
+            log.debug('%s: legacy infile: %s', jobname, legacy_infile)
             nice = self._job_or_default(jobname, job, 'nice', default=19)
             self.jobs.append(Job(
                 jobname,
                 SOG_exec, infile,
-                editfiles=default_editfiles + job_editfiles,
+                editfiles=editfiles,
                 outfile=outfile,
                 nice=nice,
                 legacy_infile=legacy_infile,
@@ -207,35 +206,28 @@ class BatchProcessor(object):
         section of the config.
         The value from the job section take priority.
         """
-        try:
+        if key in job[jobname]:
             value = job[jobname][key]
             log.debug(
-                '{}: {} from job description: {}'.format(jobname, key, value))
-        except KeyError:
-            try:
-                value = self.config[key]
-                log.debug(
-                    '{}: {} from top level defaults: {}'
-                    .format(jobname, key, value))
-            except KeyError:
-                if default is not None:
-                    value = default
-                    log.debug(
-                        '{}: {} from hard-coded default: {}'
-                        .format(jobname, key, value))
-                else:
-                    raise KeyError(
-                        'No {0} key found for job: {1}'.format(key, jobname))
+                '%s: %s from job description: %s', jobname, key, value)
+        elif key in self.config:
+            value = self.config[key]
+            log.debug(
+                '%s: %s from top level defaults: %s', jobname, key, value)
+        elif default is not None:
+            value = default
+            log.debug(
+                '%s: %s from hard-coded default: %s', jobname, key, value)
+        else:
+            raise KeyError(
+                'No {0} key found for job: {1}'.format(key, jobname))
         return value
 
     def _legacy_infile_default_rules(self):
         """Return legacy_infile value and enforce rules for its use at the top
         level of the batch config file.
         """
-        try:
-            legacy_infile = self.config['legacy_infile']
-        except KeyError:
-            legacy_infile = False
+        legacy_infile = self.config.get('legacy_infile', False)
         if legacy_infile and 'base_infile' in self.config:
             raise KeyError(
                 'Default base_infile not allowed with legacy_infile = True')
@@ -248,10 +240,7 @@ class BatchProcessor(object):
         """Return legacy_infile value and enforce rules for its use at the job
         level of the batch config file.
         """
-        try:
-            legacy_infile = job[jobname]['legacy_infile']
-        except KeyError:
-            legacy_infile = False
+        legacy_infile = job[jobname].get('legacy_infile', False)
         if legacy_infile and 'base_infile' not in job[jobname]:
             raise KeyError(
                 '{} job with legacy_infile = True requires base_infile'
@@ -284,14 +273,14 @@ class BatchProcessor(object):
         print(wrapper.fill('The following SOG jobs would have been run:'))
         print('  job name: command\n')
         for job in self.jobs:
-            cmd = '  {0.jobname}: SOG run {0.SOG_exec} {0.infile}'.format(job)
-            for edit_file in job.editfile:
-                cmd = ' '.join((cmd, '-e {}'.format(edit_file)))
-            cmd = ' '.join((cmd, '-o {0.outfile}'.format(job)))
+            cmd = [
+                '  {0.jobname}: SOG run {0.SOG_exec} {0.infile}'.format(job)]
+            cmd.extend('-e {}'.format(edit_file) for edit_file in job.editfile)
+            cmd.append('-o {0.outfile}'.format(job))
             if job.legacy_infile:
-                cmd = ' '.join((cmd, '--legacy_infile'))
-            cmd = ' '.join((cmd, '--nice {0.nice}\n'.format(job)))
-            print(cmd)
+                cmd.append('--legacy_infile')
+            cmd.append('--nice {0.nice}\n'.format(job))
+            print(' '.join(cmd))
         print(wrapper.fill(
             '{} job(s) would have been run concurrently.'
             .format(self.max_concurrent_jobs)))
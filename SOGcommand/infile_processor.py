@@ -47,11 +47,19 @@ from .SOG_YAML_schema import (
     YAML_Infile,
     yaml_to_infile,
 )
+from .yaml_loader import SafeLoader as _SafeLoader
 
 
 __all__ = ['create_infile', 'read_infile']
 
 
+# The YAML infile schema is built on first use and reused thereafter;
+# it is bound to a clone for each deserialization so it is never mutated
+_yaml_schema = None
+# Likewise the SOG infile schema, which is only used to serialize
+_sog_schema = None
+
+
 def create_infile(yaml_infile, edit_files):
     """Create a SOG Fortran-style infile for SOG to read from
     `yaml_infile`.
@@ -68,7 +76,7 @@ def create_infile(yaml_infile, edit_files):
     :rtype: str
     """
     data = _read_yaml_infile(yaml_infile)
-    YAML = YAML_Infile()
+    YAML = _get_yaml_schema()
     yaml_struct = _deserialize_yaml(data, YAML, yaml_infile)
     for edit_file in edit_files:
         edit_data = _read_yaml_infile(edit_file)
@@ -76,7 +84,7 @@ def create_infile(yaml_infile, edit_files):
             edit_data, YAML, edit_file, edit_mode=True)
         _merge_yaml_structs(edit_struct, yaml_struct, YAML)
     infile_struct = yaml_to_infile(YAML, yaml_struct)
-    SOG = SOG_Infile()
+    SOG = _get_sog_schema()
     data = SOG.serialize(infile_struct)
     with NamedTemporaryFile(mode='wt', suffix='.infile', delete=False) as f:
         SOG_infile.dump(
@@ -105,7 +113,7 @@ def read_infile(yaml_infile, edit_files, key):
     :rtype: str
     """
     data = _read_yaml_infile(yaml_infile)
-    YAML = YAML_Infile()
+    YAML = _get_yaml_schema()
     yaml_struct = _deserialize_yaml(data, YAML, yaml_infile, edit_mode=True)
     for edit_file in edit_files:
         edit_data = _read_yaml_infile(edit_file)
@@ -120,6 +128,32 @@ def read_infile(yaml_infile, edit_files, key):
     return value
 
 
+def _get_yaml_schema():
+    """Return the SOG YAML infile schema instance,
+    building it on the first call.
+
+    :returns: SOG YAML infile schema instance
+    :rtype: :class:`YAML_Infile` instance
+    """
+    global _yaml_schema
+    if _yaml_schema is None:
+        _yaml_schema = YAML_Infile()
+    return _yaml_schema
+
+
+def _get_sog_schema():
+    """Return the SOG Fortran-ish infile schema instance,
+    building it on the first call.
+
+    :returns: SOG Fortran-ish infile schema instance
+    :rtype: :class:`SOG_Infile` instance
+    """
+    global _sog_schema
+    if _sog_schema is None:
+        _sog_schema = SOG_Infile()
+    return _sog_schema
+
+
 def _read_yaml_infile(yaml_infile):
     """Read `yaml_infile` and return the resulting Python dict.
 
@@ -128,10 +162,12 @@ def _read_yaml_infile(yaml_infile):
 
     :returns data: Content of `yaml_infile` as a Python dict.
     :rtype: dict
+
+    The libyaml based C loader is used when it is available.
     """
     with open(yaml_infile, 'rt') as f:
         try:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         except yaml.scanner.ScannerError:
             print('Unable to parse {0}: Are you sure that it is YAML?'
                   .format(yaml_infile), file=sys.stderr)
@@ -188,12 +224,18 @@ def _merge_yaml_structs(edit_struct, yaml_struct, schema):
 
     :arg schema: SOG YAML infile schema instance.
     :type schema: :class:`YAML_Infile` instance
+
+    The structs are walked directly along the schema's children rather
+    than via :meth:`flatten`, :meth:`get_value` and :meth:`set_value`
+    so that the dotted path for each leaf isn't rebuilt and re-resolved
+    through the schema on every access.
     """
-    for key in schema.flatten(yaml_struct):
-        try:
-            value = schema.get_value(edit_struct, key)
-            if value is not None:
-                schema.set_value(yaml_struct, key, value)
-        except TypeError:
-            # Ignore empty block mappings
-            pass
+    for node in schema.children:
+        value = edit_struct[node.name]
+        if value is None:
+            # Ignore empty block mappings and unset values
+            continue
+        if node.children:
+            _merge_yaml_structs(value, yaml_struct[node.name], node)
+        else:
+            yaml_struct[node.name] = value
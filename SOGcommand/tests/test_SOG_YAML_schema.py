@@ -21,6 +21,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from datetime import datetime
+from decimal import Decimal
 import unittest
 try:
     from unittest.mock import Mock
@@ -168,6 +169,14 @@ class TestFloatList(unittest.TestCase):
         result = schema.deserialize({'value': [42, 24]})
         self.assertEqual(result, {'value': [42, 24]})
 
+    def test_FloatList_deserialize_decimal_item_raises_invalid(self):
+        """_FloatList deserialization of Decimal item raises Invalid
+        """
+        schema = self._make_schema()
+        self.assertRaises(
+            colander.Invalid, schema.deserialize,
+            {'value': [42, Decimal('4.2')]})
+
 
 class TestIntList(unittest.TestCase):
     """Unit tests for _IntList schema type.
@@ -234,6 +243,41 @@ class TestIntList(unittest.TestCase):
         result = schema.deserialize({'value': [42, 24]})
         self.assertEqual(result, {'value': [42, 24]})
 
+    def test_IntList_deserialize_large_int_to_list(self):
+        """_IntList deserialization of list with large integer is unchanged
+        """
+        schema = self._make_schema()
+        result = schema.deserialize({'value': [42, 2**70]})
+        self.assertEqual(result, {'value': [42, 2**70]})
+
+
+class TestYAMLInfile(unittest.TestCase):
+    """Unit tests for YAML_Infile schema.
+    """
+    def _make_schema(self):
+        from ..SOG_YAML_schema import YAML_Infile
+        return YAML_Infile()
+
+    def test_YAML_Infile_top_level_blocks(self):
+        """YAML_Infile schema has the expected top level blocks in order
+        """
+        schema = self._make_schema()
+        self.assertEqual(
+            [node.name for node in schema.children],
+            ['initial_conditions', 'end_datetime', 'location', 'grid',
+             'numerics', 'vary', 'timeseries_results', 'profiles_results',
+             'physics', 'biology', 'forcing_data'])
+
+    def test_YAML_Infile_infile_keys_unique(self):
+        """YAML_Infile schema maps each infile key from only one quantity
+        """
+        from ..SOG_YAML_schema import quantities_index
+        infile_keys = [
+            infile_key
+            for path, infile_key, var_name
+            in quantities_index(self._make_schema())]
+        self.assertEqual(len(infile_keys), len(set(infile_keys)))
+
 
 class TestYAMLtoInfile(unittest.TestCase):
     """Unit tests for yaml_to_infile data structure transformation function.
@@ -305,3 +349,17 @@ class TestYAMLtoInfile(unittest.TestCase):
             {'end datetime': {
                 'value': datetime(2012, 4, 2, 21, 21), 'units': None,
                 'description': 'end of run date/time'}})
+
+    def test_yaml_to_infile_missing_element(self):
+        """yaml_to_infile raises ValueError for missing element
+        """
+        from ..SOG_YAML_schema import YAML_Infile
+        schema = YAML_Infile().clone()
+        schema.children = [child for child in schema.children
+                           if child.name == 'grid']
+        grid_schema = schema.children[0]
+        grid_schema.children = [child for child in grid_schema
+                                if child.name == 'model_depth']
+        yaml_struct = {'grid': None}
+        self.assertRaises(
+            ValueError, self._call_yaml_to_infile, schema, yaml_struct)
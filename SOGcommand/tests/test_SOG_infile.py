@@ -76,6 +76,19 @@ class TestLoad(unittest.TestCase):
                           'description': 'depth of modelled domain',
                           'units': 'm'}})
 
+    def test_load_ignores_long_comment_block(self):
+        """load ignores comment block longer than recursion limit
+        """
+        stream = six.StringIO(
+            '! This is a comment\n' * 5000 +
+            '"maxdepth"  40.0d0  "depth of modelled domain [m]"')
+        result = self._call_load(stream)
+        self.assertEqual(
+            result,
+            {'maxdepth': {'value': '40.0d0',
+                          'description': 'depth of modelled domain',
+                          'units': 'm'}})
+
     def test_load_2_lines(self):
         """load returns expected dict for 2 SOG infile lines
         """
@@ -317,6 +330,26 @@ class TestDump(unittest.TestCase):
             '"northern_influence_strength"  0.8863d0  '
             '"strength of northen influence [m]"\n')
 
+    def test_dump_nested_extra_keys(self):
+        """dump writes extra keys of extra keys immediately after their parent
+        """
+        data = {
+            key: {'value': value, 'description': key, 'units': 'None'}
+            for key, value in (
+                ('a', '.true.'), ('b', '.true.'), ('c', '1'), ('d', '2'))}
+        key_order = ['a']
+        extra_keys = {
+            'a': {'.true.': ['b', 'c']},
+            'b': {'.true.': ['d']},
+        }
+        avg_hist_forcing_keys = {}
+        stream = six.StringIO()
+        self._call_dump(
+            data, key_order, extra_keys, avg_hist_forcing_keys, stream)
+        self.assertEqual(
+            [line.split()[0] for line in stream.getvalue().splitlines()],
+            ['"a"', '"b"', '"d"', '"c"'])
+
     def test_avg_hist_forcing_keys(self):
         """dump handles average/historical forcing keys for optional parameters
         """
@@ -21,6 +21,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from datetime import datetime
+from decimal import Decimal
 import unittest
 import colander
 
@@ -107,6 +108,20 @@ class TestRealDP_List(unittest.TestCase):
         self.assertRaises(
             colander.Invalid, schema.serialize, {'value': [42, 'foo']})
 
+    def test_RealDP_List_serialize_tuple_item_raises_invalid(self):
+        """_RealDP_List serialization of tuple list item raises Invalid
+        """
+        schema = self._make_schema()
+        self.assertRaises(
+            colander.Invalid, schema.serialize, {'value': [(42.0,)]})
+
+    def test_RealDP_List_serialize_decimal_item_raises_invalid(self):
+        """_RealDP_List serialization of Decimal list item raises Invalid
+        """
+        schema = self._make_schema()
+        self.assertRaises(
+            colander.Invalid, schema.serialize, {'value': [Decimal('4.2')]})
+
     def test_RealDP_List_serialize_list_e_format_with_d(self):
         """_RealDP_List serialization of number list is Fortran real(kind=dp)
         """
@@ -246,6 +261,20 @@ class TestDatetime(unittest.TestCase):
         result = schema.deserialize({'value': '2012-04-01 19:14:00'})
         self.assertEqual(result, {'value': datetime(2012, 4, 1, 19, 14)})
 
+    def test_Datetime_deserialize_unpadded_string_to_datetime(self):
+        """_Datetime deserialization of unpadded datetime string is datetime
+        """
+        schema = self._make_schema()
+        result = schema.deserialize({'value': '2012-4-1 19:14:00'})
+        self.assertEqual(result, {'value': datetime(2012, 4, 1, 19, 14)})
+
+    def test_Datetime_deserialize_out_of_range_raises_value_error(self):
+        """_Datetime deserialization of out of range datetime raises ValueError
+        """
+        schema = self._make_schema()
+        self.assertRaises(
+            ValueError, schema.deserialize, {'value': '2012-13-01 19:14:00'})
+
 
 class TestBoolean(unittest.TestCase):
     """Unit tests for _Boolean schema type.
@@ -305,6 +334,13 @@ class TestBoolean(unittest.TestCase):
         result = schema.deserialize({'value': '.true.'})
         self.assertEqual(result, {'value': True})
 
+    def test_Boolean_deserialize_upper_case_true(self):
+        """_Boolean deserialization of .TRUE. is True
+        """
+        schema = self._make_schema()
+        result = schema.deserialize({'value': '.TRUE.'})
+        self.assertEqual(result, {'value': True})
+
     def test_Boolean_deserialize_flase(self):
         """_Boolean deserialization of .false. is False
         """
@@ -446,3 +482,32 @@ class TestInfileToYAML(unittest.TestCase):
                 'value': datetime(2012, 4, 2, 19, 1),
                 'variable name': 'endDatetime',
                 'description': 'end of run date/time'}})
+
+    def test_infile_to_yaml_infile_key_with_dot(self):
+        """infile_to_yaml handles infile key that contains a dot
+        """
+        from ..SOG_infile_schema import SOG_Infile
+        from .. SOG_YAML_schema import YAML_Infile
+        infile_schema = SOG_Infile().clone()
+        yaml_schema = YAML_Infile().clone()
+        yaml_schema.children = [child for child in yaml_schema.children
+                                if child.name == 'biology']
+        biology_schema = yaml_schema.children[0]
+        biology_schema.children = [child for child in biology_schema
+                                   if child.name == 'mesozooplankton']
+        mesozoo_schema = biology_schema.children[0]
+        mesozoo_schema.children = [
+            child for child in mesozoo_schema
+            if child.name == 'mesozoo_assimilation_efficiency']
+        infile_struct = {'Mesozoo, assimil. eff': {
+            'value': 0.5, 'units': None,
+            'description': 'mesozoo assimilation efficiency'}}
+        result = self._call_infile_to_yaml(
+            yaml_schema, infile_schema, infile_struct)
+        self.assertEqual(
+            result,
+            {'biology': {
+                'mesozooplankton': {
+                    'mesozoo_assimilation_efficiency': {
+                        'value': 0.5, 'variable name': 'rate_mesozoo%eff',
+                        'description': 'mesozoo assimilation efficiency'}}}})
@@ -49,7 +49,7 @@ class TestCreateInfile(unittest.TestCase):
     @patch.object(infile_processor, '_read_yaml_infile')
     @patch.object(infile_processor, '_deserialize_yaml')
     @patch.object(infile_processor, 'yaml_to_infile')
-    @patch.object(infile_processor, 'SOG_Infile')
+    @patch.object(infile_processor, '_get_sog_schema')
     @patch.object(infile_processor, 'SOG_infile')
     @patch.object(infile_processor, 'NamedTemporaryFile')
     def test_create_infile_returns_temp_file_name(
@@ -64,7 +64,7 @@ class TestCreateInfile(unittest.TestCase):
     @patch.object(infile_processor, '_read_yaml_infile')
     @patch.object(infile_processor, '_deserialize_yaml')
     @patch.object(infile_processor, 'yaml_to_infile')
-    @patch.object(infile_processor, 'SOG_Infile')
+    @patch.object(infile_processor, '_get_sog_schema')
     @patch.object(infile_processor, 'SOG_infile')
     @patch.object(infile_processor, 'NamedTemporaryFile')
     def test_create_infile_reads_edit_files(
@@ -108,6 +108,42 @@ class TestReadInfile(unittest.TestCase):
         self.assertEqual(mock_stderr.getvalue(), 'KeyError: bar\n')
 
 
+class TestGetYamlSchema(unittest.TestCase):
+    """Unit tests for _get_yaml_schema function.
+    """
+    def _call_fut(self):
+        """Call function under test.
+        """
+        return infile_processor._get_yaml_schema()
+
+    @patch.object(infile_processor, '_yaml_schema', None)
+    @patch.object(infile_processor, 'YAML_Infile')
+    def test_get_yaml_schema_builds_schema_once(self, mock_YI):
+        """_get_yaml_schema builds the schema only on the first call
+        """
+        schema = self._call_fut()
+        self.assertIs(self._call_fut(), schema)
+        mock_YI.assert_called_once_with()
+
+
+class TestGetSogSchema(unittest.TestCase):
+    """Unit tests for _get_sog_schema function.
+    """
+    def _call_fut(self):
+        """Call function under test.
+        """
+        return infile_processor._get_sog_schema()
+
+    @patch.object(infile_processor, '_sog_schema', None)
+    @patch.object(infile_processor, 'SOG_Infile')
+    def test_get_sog_schema_builds_schema_once(self, mock_SI):
+        """_get_sog_schema builds the schema only on the first call
+        """
+        schema = self._call_fut()
+        self.assertIs(self._call_fut(), schema)
+        mock_SI.assert_called_once_with()
+
+
 class TestReadYamlInfile(unittest.TestCase):
     """Unit tests for _read_yaml_infile function.
     """
@@ -116,7 +152,7 @@ class TestReadYamlInfile(unittest.TestCase):
         """
         return infile_processor._read_yaml_infile(*args)
 
-    @patch.object(infile_processor.yaml, 'safe_load')
+    @patch.object(infile_processor.yaml, 'load')
     def test_read_yaml_infile_loads_yaml_file(self, mock_load):
         """
         """
@@ -124,7 +160,8 @@ class TestReadYamlInfile(unittest.TestCase):
         with patch.object(infile_processor, 'open', m, create=True):
             mock_file_obj = m.return_value.__enter__.return_value
             self._call_fut('foo.yaml')
-        mock_load.assert_called_once_with(mock_file_obj)
+        mock_load.assert_called_once_with(
+            mock_file_obj, Loader=infile_processor._SafeLoader)
 
     @patch('sys.stderr', new_callable=six.StringIO)
     def test_read_yaml_infile_handles_invalid_yaml_file(self, mock_stderr):
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""YAML loader selection for the SOG command processor.
+
+The YAML infile and batch file readers load their files with the
+:class:`SafeLoader` class that this module provides.
+
+:Author: Doug Latornell <djl@douglatornell.ca>
+:License: Apache License, Version 2.0
+
+
+Copyright 2010-2014 Doug Latornell and The University of British Columbia
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML built without the libyaml C extension
+    from yaml import SafeLoader
+
+
+__all__ = ['SafeLoader']